@@ -3,13 +3,24 @@ A more sophisticated and pythonic version of the LRms-beaconmaster.py script.
 Aiming for a modular design and easier to add to down the road.
 '''
 
-from datetime import datetime
 import curses
-from collections import deque
+import os
+import queue
 import threading
+import select
+import selectors
+import sys
+import time
+import unicodedata
 import serial
 
 BEACON_INTERVAL = 60  # seconds
+INPUT_POLL_INTERVAL = 0.1  # seconds
+MIN_HEIGHT = 3  # rows, banner + divider + input field
+BANNER = " Welcome to LRms Beacon Master V2.0 by Andy Kirby "
+
+AT_RESET = b'AT+RESET\r\n'
+AT_OPMODE = b'AT+OPMODE=1\r\n'
 
 class DeviceConnection:
     """
@@ -25,6 +36,9 @@ class DeviceConnection:
         node_id (int): Node ID for the device.
         tx_power (int): Transmission power in dBm.
         lora_params (str): LoRa parameters string.
+        _cancel (threading.Event): Set by close() to cut configuration waits short.
+        _fd (int): File descriptor of the open serial port.
+        _rx_tail (bytes): Partial line left over from the previous read.
     """
 
     def __init__(self, port='/dev/ttyS0', rf_freq=867500000, node_id=1, tx_power=22, lora_params='9,7,1,12', device_type='RYLR993'):
@@ -45,28 +59,53 @@ class DeviceConnection:
         if device_type not in ['RYLR993', 'RYLR998']:
             raise ValueError('Device type must be RYLR993 or RYLR998')
         baud_rates = {'RYLR993': 9600, 'RYLR998': 115200}
-        self.ser = serial.Serial(port, baud_rates[device_type], timeout=1)
+        self.ser = serial.Serial(port, baud_rates[device_type], timeout=1, write_timeout=1)
         self.device_type = device_type
         self.rf_freq = rf_freq
         self.node_id = node_id
         self.tx_power = tx_power
         self.lora_params = lora_params
+        self._cancel = threading.Event()
+        self._fd = self.ser.fileno()
+        self._rx_tail = b''
 
-    def read_serial(self, max_reads=100):
+    def read_serial(self, timeout=0.05):
         """
         Read data from the serial connection.
 
+        Waits up to `timeout` seconds for the port to become readable, then
+        takes everything the driver has queued with a single read on the file
+        descriptor. Pass a timeout of 0 when the caller already knows the port
+        is readable. A trailing partial line is kept until the rest of it
+        arrives.
+
         Args:
-            max_reads (int): Maximum number of read attempts.
+            timeout (float): Seconds to wait for data to arrive.
 
         Yields:
             str: Decoded data read from the serial connection.
-        """
-        for _ in range(max_reads):
-            data = self.ser.readline().decode('utf-8').strip()
-            if not data:
-                break
-            yield data
+
+        Raises:
+            serial.SerialException: If the device has been disconnected.
+        """
+        if timeout:
+            readable, _, _ = select.select([self._fd], [], [], timeout)
+            if not readable:
+                return
+        try:
+            block = os.read(self._fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            raise serial.SerialException(f"read failed: {e}") from e
+        if not block:  # Readable but empty means the port has gone away
+            raise serial.SerialException("device disconnected")
+        lines = (self._rx_tail + block).split(b'\n')
+        self._rx_tail = lines.pop()
+        for line in lines:
+            data = line.rstrip(b'\r').decode('utf-8', 'replace')
+            if data:
+                yield data
 
     def write_serial(self, text):
         """
@@ -77,35 +116,52 @@ class DeviceConnection:
         """
         self.ser.write(text.encode())
 
+    def write_bytes(self, data):
+        """
+        Write pre-encoded data to the serial connection.
+
+        Args:
+            data (bytes): Data to be written to the serial connection.
+        """
+        self.ser.write(data)
+
     def configure_device(self):
         """
         Configure the LoRa device with the specified settings.
 
         This method sends a series of AT commands to set up the device
-        according to the initialised parameters.
+        according to the initialised parameters. Only the reset and mode
+        change need settle time, the module accepts the remaining commands
+        back-to-back.
         """
-        self.write_serial('AT+RESET\r\n')
-        threading.Event().wait(2)
+        self.ser.write(AT_RESET)
+        self._cancel.wait(2)
         if self.device_type == 'RYLR993':
-            self.write_serial('AT+OPMODE=1\r\n')
-            threading.Event().wait(2)
-            self.write_serial('AT+RESET\r\n')
-            threading.Event().wait(2)
-        self.write_serial(f'AT+BAND={self.rf_freq}\r\n')
-        threading.Event().wait(1)
-        self.write_serial(f'AT+ADDRESS={self.node_id}\r\n')
-        threading.Event().wait(1)
-        self.write_serial(f'AT+CRFOP={self.tx_power}\r\n')
-        threading.Event().wait(1)
-        self.write_serial(f'AT+PARAMETER={self.lora_params}\r\n')
-        threading.Event().wait(1)
-        for _ in self.read_serial():
-            pass  # Consume all responses
+            self.ser.write(AT_OPMODE)
+            self._cancel.wait(2)
+            self.ser.write(AT_RESET)
+            self._cancel.wait(2)
+        self.ser.write(b''.join([
+            b'AT+BAND=%d\r\n' % self.rf_freq,
+            b'AT+ADDRESS=%d\r\n' % self.node_id,
+            b'AT+CRFOP=%d\r\n' % self.tx_power,
+            b'AT+PARAMETER=%s\r\n' % self.lora_params.encode(),
+        ]))
+
+        # Consume all responses
+        deadline = time.monotonic() + 1
+        while time.monotonic() < deadline:
+            waiting = self.ser.in_waiting
+            if waiting:
+                self.ser.read(waiting)
+            else:
+                time.sleep(0.05)
 
     def close(self):
         """
         Close the serial connection to the device.
         """
+        self._cancel.set()
         if self.ser.is_open:
             self.ser.close()
 
@@ -118,6 +174,8 @@ class Commander:
 
     Attributes:
         device_connection (DeviceConnection): The device connection object.
+        _prepared (bytes): Encoded frame cached by prepare().
+        _prepared_desc (str): Description of the cached frame.
     """
 
     def __init__(self, device_connection):
@@ -128,21 +186,57 @@ class Commander:
             device_connection (DeviceConnection): The device connection object.
         """
         self.device_connection = device_connection
+        self._prepared = None
+        self._prepared_desc = None
 
     def send_at_command(self, command):
         """
         Send an AT command to the LoRa device.
 
         Args:
-            command (str): The command to send.
+            command (str | bytes): The command to send.
+
+        Returns:
+            str: A string describing the sent command.
+        """
+        full_command = self.build_frame(command)
+        self.device_connection.write_bytes(full_command)
+        return f"Sent command: {full_command.decode().strip()}"
+
+    @staticmethod
+    def build_frame(command):
+        """
+        Build the encoded AT+SEND frame for a command.
+
+        Args:
+            command (str | bytes): The command to send.
+
+        Returns:
+            bytes: The encoded frame.
+        """
+        if isinstance(command, str):
+            command = command.encode()
+        return b"AT+SEND=0,%d,%s\r\n" % (len(command), command)
+
+    def prepare(self, command):
+        """
+        Build and cache the frame for a command that is sent repeatedly.
+
+        Args:
+            command (str): The command to prepare.
+        """
+        self._prepared = self.build_frame(command)
+        self._prepared_desc = f"Sent command: {self._prepared.decode().strip()}"
+
+    def send_prepared(self):
+        """
+        Send the frame cached by prepare().
 
         Returns:
             str: A string describing the sent command.
         """
-        cmd_length = len(command)
-        full_command = f"AT+SEND=0,{cmd_length},{command}\r\n"
-        self.device_connection.write_serial(full_command)
-        return f"Sent command: {full_command.strip()}"
+        self.device_connection.write_bytes(self._prepared)
+        return self._prepared_desc
 
 class BeaconMasterUI:
     """
@@ -156,11 +250,27 @@ class BeaconMasterUI:
         device_connection (DeviceConnection): The device connection object.
         commander (Commander): The commander object for sending commands.
         max_lines (int): Maximum number of lines in the output buffer.
-        output_buffer (collections.deque): Buffer for storing output messages.
+        _ring (list): Ring buffer of formatted output lines, kept at full
+            length so they can be re-truncated when the screen is resized.
+        _head (int): Index in the ring buffer the next line is written to.
+        _count (int): Number of ring buffer slots holding a line.
+        _pad (curses.window): Pad mirroring the ring buffer, one row per line,
+            truncated to the screen width.
+        _pending (queue.SimpleQueue): Lines waiting to be added to the ring buffer.
         input_active (bool): Flag indicating if input is active.
-        user_input (str): Current user input string.
+        user_input_chars (list): Characters of the beacon text being typed.
         beacon_text (str): Text to be used for beaconing.
-        stop_event (threading.Event): Event for signaling threads to stop.
+        stop_event (threading.Event): Event for signaling the main loop to stop.
+        _key_handlers (dict): Handlers for keys acted on at any time.
+        _input_handlers (dict): Handlers for editing keys while input is active.
+        _prev_lines (list): Snapshot of each row as drawn in the previous frame.
+        _banner (str): Banner centred to the screen width.
+        _divider (str): Divider line below the banner.
+        _blank (str): Blank row spanning the screen width.
+        _dirty (bool): Flag indicating the screen needs redrawing.
+        _last_sec (int): Second the cached timestamp was formatted for.
+        _last_ts (str): Cached formatted timestamp.
+        _next_beacon (float): Monotonic time the next beacon is due.
     """
 
     def __init__(self, stdscr, device_connection, commander, max_lines=100):
@@ -177,37 +287,145 @@ class BeaconMasterUI:
         self.device_connection = device_connection
         self.commander = commander
         self.max_lines = max_lines
-        self.output_buffer = deque(maxlen=max_lines)
+        self._ring = [""] * max_lines
+        self._head = 0
+        self._count = 0
+        self._pending = queue.SimpleQueue()
         self.input_active = False
-        self.user_input = ""
+        self.user_input_chars = []
         self.beacon_text = "LRms Beacon"
+        self.commander.prepare(self.beacon_text)
         self.setup_curses()
         self.stop_event = threading.Event()
+        self._key_handlers = {
+            'q': self._quit,
+            curses.KEY_RESIZE: self._resize,
+            'b': self._toggle_input,
+        }
+        self._input_handlers = {
+            '\n': self._submit_input,  # Enter key
+            '\x1b': self._cancel_input,  # Escape key
+            curses.KEY_BACKSPACE: self._backspace,
+            '\x7f': self._backspace,
+        }
+        self._dirty = True
+        self._last_sec = 0
+        self._last_ts = ""
 
     def setup_curses(self):
         """
         Set up the curses environment.
         """
         curses.curs_set(0)
+        self.stdscr.nodelay(True)  # getch() returns -1 rather than blocking
+        # Don't let doupdate() poll stdin between rows, so each frame goes
+        # out as a single buffered write instead of being split up.
+        curses.typeahead(-1)
         self.stdscr.clear()
         self.stdscr.refresh()
         self.height, self.width = self.stdscr.getmaxyx()
+        self._prev_lines = [None] * self.height
+        self._recompute_chrome()
+        self.build_pad()
+
+    def _recompute_chrome(self):
+        """
+        Rebuild the fixed strings drawn every frame for the current screen width.
+        """
+        self._banner = BANNER.center(self.width)
+        self._divider = "-" * (self.width - 1)
+        self._blank = " " * (self.width - 1)
+
+    @staticmethod
+    def fit_cells(text, cells):
+        """
+        Cut or pad text to fill exactly a number of screen cells.
+
+        Wide characters (CJK, emoji) take two cells and combining marks none.
+        Control characters such as tabs are replaced with '?', since curses
+        would otherwise expand them.
+
+        Args:
+            text (str): The text to fit.
+            cells (int): Number of screen cells to fill.
+
+        Returns:
+            str: The fitted text.
+        """
+        if text.isascii() and text.isprintable():
+            return text[:cells].ljust(cells)
+        out = []
+        used = 0
+        for ch in text:
+            if not ch.isprintable():
+                ch = '?'
+            if unicodedata.combining(ch):
+                width = 0
+            elif unicodedata.east_asian_width(ch) in ('W', 'F'):
+                width = 2
+            else:
+                width = 1
+            if used + width > cells:
+                break
+            out.append(ch)
+            used += width
+        return "".join(out) + " " * (cells - used)
+
+    def build_pad(self):
+        """
+        Create the output pad at the current width and fill it from the ring buffer.
+        """
+        self._pad = curses.newpad(self.max_lines, self.width)
+        for row, line in enumerate(self._ring):
+            try:
+                self._pad.addstr(row, 0, self.fit_cells(line, self.width - 1))
+            except curses.error:
+                pass  # Leave a row curses can't draw blank rather than crash
+
+    def draw_line(self, y, text, attr=curses.A_NORMAL):
+        """
+        Draw a single row, skipping it if unchanged since the previous frame.
+
+        The text is fitted by display cells to fill the row up to the last
+        column, so wide characters don't push a long row off the screen.
+
+        Args:
+            y (int): Row to draw on.
+            text (str): Text for the row.
+            attr (int): Curses attribute for the row.
+        """
+        if self._prev_lines[y] == text:
+            return
+        try:
+            self.stdscr.addstr(y, 0, self.fit_cells(text, self.width - 1), attr)
+        except curses.error:
+            pass  # Drawing into the last cell of the screen still reports an error
+        self._prev_lines[y] = text
 
     def display_banner(self):
         """
         Display the banner at the top of the screen.
         """
-        banner = " Welcome to LRms Beacon Master V2.0 by Andy Kirby "
-        self.stdscr.addstr(0, 0, banner.center(self.width), curses.A_REVERSE)
-        self.stdscr.addstr(1, 0, "-" * (self.width - 1))
+        self.draw_line(0, self._banner, curses.A_REVERSE)
+        self.draw_line(1, self._divider)
 
     def display_output(self):
         """
         Display the output buffer on the screen.
+
+        The newest lines are copied straight from the pad, filling the
+        output area from the top until it is full. When they wrap around the
+        end of the ring buffer this takes two copies.
         """
-        for idx, line in enumerate(self.output_buffer):
-            if idx + 2 < self.height - 2:
-                self.stdscr.addstr(idx + 2, 0, line[:self.width-1])
+        rows = min(self.height - 4, self._count)
+        if rows <= 0:
+            return
+        pad, right, max_lines = self._pad, self.width - 1, self.max_lines
+        start = (self._head - rows) % max_lines
+        first = min(rows, max_lines - start)
+        pad.noutrefresh(start, 0, 2, 0, 1 + first, right)
+        if first < rows:
+            pad.noutrefresh(0, 0, 2 + first, 0, 1 + rows, right)
 
     def display_input_field(self):
         """
@@ -215,97 +433,236 @@ class BeaconMasterUI:
         """
         if self.input_active:
             prompt = "Enter Beacon Text (Max 50 chars): "
-            self.stdscr.addstr(self.height - 1, 0, prompt + self.user_input)
+            self.draw_line(self.height - 1, prompt + "".join(self.user_input_chars))
         else:
-            self.stdscr.addstr(self.height - 1, 0, " " * (self.width - 1))
+            self.draw_line(self.height - 1, self._blank)
 
     def add_message(self, message):
         """
         Add a message to the output buffer.
 
+        The line is queued and picked up by the next update(), so a burst of
+        messages is drawn in a single frame. Safe to call from threads other
+        than the one running the UI.
+
         Args:
             message (str): The message to add.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.output_buffer.append(f"[{timestamp}] {message}")
+        self._pending.put(f"[{self._ts()}] {message}")
+
+    def drain_pending(self):
+        """
+        Move queued lines into the ring buffer and pad.
+
+        Each line is fitted to the screen width once here, as it is written
+        to the pad, so drawing it never has to slice it again.
+        """
+        # Bind what the loop touches to locals, a burst can be many lines long
+        get, ring, addstr, fit = self._pending.get_nowait, self._ring, self._pad.addstr, self.fit_cells
+        width, max_lines, head = self.width - 1, self.max_lines, self._head
+        added = 0
+        try:
+            while True:
+                line = get()
+                ring[head] = line
+                try:
+                    addstr(head, 0, fit(line, width))
+                except curses.error:
+                    pass  # Leave a row curses can't draw blank rather than crash
+                head = (head + 1) % max_lines
+                added += 1
+        except queue.Empty:
+            pass
+        if added:
+            self._head = head
+            self._count = min(self._count + added, max_lines)
+            self._dirty = True
+
+    def _ts(self):
+        """
+        Get the current timestamp, reformatting it at most once a second.
+
+        Returns:
+            str: The formatted timestamp.
+        """
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        return self._last_ts
 
     def handle_input(self, ch):
         """
         Handle user input.
 
+        Keys are looked up in two dispatch tables: one for keys handled at
+        any time, and one for keys that only mean something while beacon
+        text is being typed. Any other character typed in input mode is
+        appended to the text.
+
         Args:
-            ch (int): The character input by the user.
+            ch (str | int): The character input by the user, or a curses key
+                code for function keys, as returned by get_wch().
 
         Returns:
             bool: True if the application should continue, False to exit.
         """
-        if ch == ord('q'):
-            return False
-        elif ch == ord('b'):
-            self.input_active = not self.input_active
-        elif self.input_active:
-            if ch == 10:  # Enter key
-                self.beacon_text = self.user_input
-                self.add_message(f"New beacon text set: {self.beacon_text}")
-                self.user_input = ""
-                self.input_active = False
-            elif ch == 27:  # Escape key
-                self.input_active = False
-                self.user_input = ""
-            elif ch == curses.KEY_BACKSPACE or ch == 127:
-                self.user_input = self.user_input[:-1]
-            elif len(self.user_input) < 50:
-                self.user_input += chr(ch)
+        handler = self._key_handlers.get(ch)
+        if handler is not None:
+            return handler()
+        if self.input_active:
+            self._dirty = True
+            handler = self._input_handlers.get(ch)
+            if handler is not None:
+                handler()
+            elif isinstance(ch, str) and len(self.user_input_chars) < 50:
+                self.user_input_chars.append(ch)
         return True
 
-    def update(self):
+    def _quit(self):
+        """
+        Handle the quit key.
+
+        Returns:
+            bool: Always False, to exit the application.
         """
-        Update the screen display.
+        return False
+
+    def _resize(self):
+        """
+        Handle a terminal resize.
+
+        Returns:
+            bool: Always True.
         """
+        self.height, self.width = self.stdscr.getmaxyx()
+        self._prev_lines = [None] * self.height
+        self._recompute_chrome()
+        self.build_pad()
         self.stdscr.clear()
+        self._dirty = True
+        return True
+
+    def _toggle_input(self):
+        """
+        Show or hide the beacon text input field.
+
+        Returns:
+            bool: Always True.
+        """
+        self.input_active = not self.input_active
+        self._dirty = True
+        return True
+
+    def _submit_input(self):
+        """
+        Set the typed text as the new beacon text.
+        """
+        self.beacon_text = "".join(self.user_input_chars)
+        self.commander.prepare(self.beacon_text)
+        self.add_message(f"New beacon text set: {self.beacon_text}")
+        self.user_input_chars.clear()
+        self.input_active = False
+
+    def _cancel_input(self):
+        """
+        Discard the typed text and close the input field.
+        """
+        self.input_active = False
+        self.user_input_chars.clear()
+
+    def _backspace(self):
+        """
+        Delete the last typed character.
+        """
+        if self.user_input_chars:
+            self.user_input_chars.pop()
+
+    def update(self):
+        """
+        Update the screen display, if anything has changed since the last update.
+
+        Any queued messages are added to the output first. Only rows that
+        changed since the last frame are written to the virtual screen, which
+        is then flushed to the terminal in one go. The output pad is copied
+        after stdscr so it isn't overwritten. Nothing is drawn while the
+        terminal is too small to hold the banner, divider and input rows; the
+        next KEY_RESIZE redraws everything.
+        """
+        self.drain_pending()
+        if not self._dirty or self.height < MIN_HEIGHT:
+            return
         self.display_banner()
-        self.display_output()
         self.display_input_field()
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
+        self.display_output()
+        curses.doupdate()
+        self._dirty = False
 
     def run(self):
         """
         Run the main application loop.
-        """
-        beacon_thread = threading.Thread(target=self.send_beacon)
-        beacon_thread.start()
 
-        serial_read_thread = threading.Thread(target=self.read_serial)
-        serial_read_thread.start()
+        Keyboard input, incoming serial data and the beacon interval are all
+        serviced from a single selector rather than separate threads. Each
+        registered file carries the callback to run when it becomes readable.
+        The keyboard is polled on every pass instead, at least every
+        INPUT_POLL_INTERVAL, since curses only reports some input (such as
+        KEY_RESIZE) from getch(); stdin is registered only to wake the loop.
+        """
+        sel = selectors.DefaultSelector()
+        sel.register(sys.stdin, selectors.EVENT_READ, None)
+        sel.register(self.device_connection.ser, selectors.EVENT_READ, self.read_serial)
+        self._next_beacon = time.monotonic()
+
+        try:
+            while not self.stop_event.is_set():
+                now = time.monotonic()
+                if now >= self._next_beacon:
+                    self.send_beacon()
+                    # Stay on the original schedule, skipping any missed slots
+                    while self._next_beacon <= now:
+                        self._next_beacon += BEACON_INTERVAL
+                self.update()
+
+                timeout = min(INPUT_POLL_INTERVAL, max(0, self._next_beacon - time.monotonic()))
+                for key, _ in sel.select(timeout):
+                    if key.data is not None:
+                        key.data()
+                self.read_keys()
+        finally:
+            sel.close()
+        self.device_connection.close()
 
-        while not self.stop_event.is_set():
-            self.update()
-            ch = self.stdscr.getch()
+    def read_keys(self):
+        """
+        Handle all keypresses waiting in the curses input queue.
+
+        get_wch() is used rather than getch() so that non-ASCII characters
+        arrive whole instead of as separate UTF-8 bytes.
+        """
+        while True:
+            try:
+                ch = self.stdscr.get_wch()
+            except curses.error:  # No input waiting
+                return
             if not self.handle_input(ch):
                 self.stop_event.set()
-                break
-
-        beacon_thread.join()
-        serial_read_thread.join()
-        self.device_connection.close()
+                return
 
     def send_beacon(self):
         """
-        Send beacon messages at regular intervals.
+        Send a beacon message.
         """
-        while not self.stop_event.is_set():
-            message = self.commander.send_at_command(self.beacon_text)
-            self.add_message(f"Beaconing: {message}")
-            self.stop_event.wait(BEACON_INTERVAL)
+        message = self.commander.send_prepared()
+        self.add_message(f"Beaconing: {message}")
 
     def read_serial(self):
         """
-        Continuously read from the serial port.
+        Read any data waiting on the serial port.
         """
-        while not self.stop_event.is_set():
-            for data in self.device_connection.read_serial():
-                self.add_message(f"Received: {data}")
-            self.stop_event.wait(0.1)
+        for data in self.device_connection.read_serial(timeout=0):
+            self.add_message(f"Received: {data}")
 
 def main(stdscr):
     """
@@ -323,6 +680,7 @@ def main(stdscr):
     except serial.SerialException as e:
         stdscr.addstr(0, 0, f"Serial Error: {e}")
         stdscr.refresh()
+        stdscr.nodelay(False)  # Wait for a key before exiting
         stdscr.getch()
 
 if __name__ == "__main__":
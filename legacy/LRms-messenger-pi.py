@@ -4,12 +4,19 @@ Aiming for a modular design and easier to add to down the road.
 """
 
 
-from datetime import datetime
 from collections import deque
+import re
+import selectors
 import threading
+import time
 import serial
 import RPi.GPIO as GPIO
 
+# +RCV=<address>,<length>,<data>,<rssi>,<snr>
+_RCV_RE = re.compile(rb"\+RCV=(\d+),\d+,(.*),(-?\d+),(-?\d+)")
+
+AT_RESET = b'AT+RESET\r\n'
+AT_OPMODE = b'AT+OPMODE=1\r\n'
 
 class DeviceConnection:
     """
@@ -24,6 +31,9 @@ class DeviceConnection:
         node_id (int): Node ID for the device.
         tx_power (int): Transmission power in dBm.
         lora_params (str): LoRa parameters string.
+        _cancel (threading.Event): Set by close() to cut configuration waits short.
+        _rx_tail (bytes): Partial line left over from the previous read.
+        _sel (selectors.BaseSelector): Selector watching the port for incoming data.
     """
 
     def __init__(self, port='/dev/ttyS0', rf_freq=867500000, node_id=1, tx_power=22, lora_params='9,7,1,12', device_type='RYLR993'):
@@ -45,28 +55,41 @@ class DeviceConnection:
             raise ValueError('Device type must be RYLR993 or RYLR998')
 
         baud_rates = {'RYLR993': 9600, 'RYLR998': 115200}
-        self.uart = serial.Serial(port, baud_rates[device_type], timeout=1)
+        self.uart = serial.Serial(port, baud_rates[device_type], timeout=1, write_timeout=1)
         self.device_type = device_type
         self.rf_freq = rf_freq
         self.node_id = node_id
         self.tx_power = tx_power
         self.lora_params = lora_params
+        self._cancel = threading.Event()
+        self._rx_tail = b''
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.uart, selectors.EVENT_READ)
 
-    def read_serial(self, max_reads=100):
+    def read_serial(self, timeout=1):
         """
         Read data from the serial connection.
 
+        If nothing is buffered, waits up to `timeout` seconds for the port to
+        become readable. Everything buffered is then read as one block and
+        split into lines. A trailing partial line is kept until the rest of
+        it arrives.
+
         Args:
-            max_reads (int): Maximum number of read attempts.
+            timeout (float): Seconds to wait for data to arrive.
 
         Yields:
-            str: Decoded data read from the serial connection.
-        """
-        for _ in range(max_reads):
-            data = self.uart.readline().decode('utf-8').strip()
-            if not data:
-                break
-            yield data
+            bytes: Lines read from the serial connection, without line endings.
+        """
+        if not self.uart.in_waiting and not self._sel.select(timeout):
+            return
+        block = self.uart.read(self.uart.in_waiting)
+        lines = (self._rx_tail + block).split(b'\n')
+        self._rx_tail = lines.pop()
+        for line in lines:
+            data = line.rstrip(b'\r')
+            if data:
+                yield data
 
     def write_serial(self, text):
         """
@@ -77,33 +100,39 @@ class DeviceConnection:
         """
         self.uart.write(text.encode())
 
+    def write_bytes(self, data):
+        """
+        Write pre-encoded data to the serial connection.
+
+        Args:
+            data (bytes): Data to be written to the serial connection.
+        """
+        self.uart.write(data)
+
     def configure_device(self):
         """
         Configure the LoRa device with the specified settings.
         This method sends a series of AT commands to set up the device
-        according to the initialized parameters.
+        according to the initialized parameters. Only the reset and mode
+        change need settle time, the remaining settings go out in one write.
         """
-        self.write_serial('AT+RESET\r\n')
-        threading.Event().wait(2)
+        self.uart.write(AT_RESET)
+        self._cancel.wait(2)
 
         if self.device_type == 'RYLR993':
-            self.write_serial('AT+OPMODE=1\r\n')
-            threading.Event().wait(2)
-
-        self.write_serial('AT+RESET\r\n')
-        threading.Event().wait(2)
+            self.uart.write(AT_OPMODE)
+            self._cancel.wait(2)
 
-        self.write_serial(f'AT+BAND={self.rf_freq}\r\n')
-        threading.Event().wait(1)
+        self.uart.write(AT_RESET)
+        self._cancel.wait(2)
 
-        self.write_serial(f'AT+ADDRESS={self.node_id}\r\n')
-        threading.Event().wait(1)
-
-        self.write_serial(f'AT+CRFOP={self.tx_power}\r\n')
-        threading.Event().wait(1)
-
-        self.write_serial(f'AT+PARAMETER={self.lora_params}\r\n')
-        threading.Event().wait(1)
+        self.uart.write(b''.join([
+            b'AT+BAND=%d\r\n' % self.rf_freq,
+            b'AT+ADDRESS=%d\r\n' % self.node_id,
+            b'AT+CRFOP=%d\r\n' % self.tx_power,
+            b'AT+PARAMETER=%s\r\n' % self.lora_params.encode(),
+        ]))
+        self._cancel.wait(1)
 
         for _ in self.read_serial():
             pass  # Consume all responses
@@ -112,6 +141,8 @@ class DeviceConnection:
         """
         Close the serial connection to the device.
         """
+        self._cancel.set()
+        self._sel.close()
         if self.uart.is_open:
             self.uart.close()
 
@@ -124,6 +155,7 @@ class MessageHandler:
 
     Attributes:
         device_connection (DeviceConnection): The device connection object.
+        _ack_frames (dict): Encoded ACK frames and descriptions by station ID.
     """
 
     def __init__(self, device_connection):
@@ -134,34 +166,27 @@ class MessageHandler:
             device_connection (DeviceConnection): The device connection object.
         """
         self.device_connection = device_connection
+        self._ack_frames = {}
 
     def parse_received_message(self, received_data):
         """
         Parse the received message and extract relevant information.
 
         Args:
-            received_data (str): The received data string.
+            received_data (bytes): The received data line.
 
         Returns:
-            dict: A dictionary containing parsed message information.
+            dict: A dictionary containing parsed message fields as bytes.
         """
-        if "+RCV" not in received_data:
-            return None
-
-        data_parts = received_data.split(",")
-        stationid = data_parts[0].split("=")[1]
-        msgcontent = data_parts[2]
-        rssi = data_parts[3]
-        snr = data_parts[4]
-
-        if "RPT" in msgcontent:
+        match = _RCV_RE.match(received_data)
+        if not match or b"RPT" in match.group(2):
             return None
 
         return {
-            "stationid": stationid,
-            "msgcontent": msgcontent,
-            "rssi": rssi,
-            "snr": snr
+            "stationid": match.group(1),
+            "msgcontent": match.group(2),
+            "rssi": match.group(3),
+            "snr": match.group(4)
         }
 
     def send_message(self, message):
@@ -184,13 +209,21 @@ class MessageHandler:
         Send an acknowledgment message.
 
         Args:
-            stationid (str): The station ID to acknowledge.
+            stationid (str | bytes): The station ID to acknowledge, as text or
+                as parsed by parse_received_message().
 
         Returns:
             str: A string describing the sent acknowledgment.
         """
-        ack_message = f"ACK {stationid}"
-        return self.send_message(ack_message)
+        if isinstance(stationid, bytes):
+            stationid = stationid.decode('ascii')
+        cached = self._ack_frames.get(stationid)
+        if cached is None:
+            ack_message = f"ACK {stationid}"
+            frame = f"AT+SEND=0,{len(ack_message)},{ack_message}\r\n".encode()
+            cached = self._ack_frames[stationid] = (frame, f"Message sent: {ack_message}")
+        self.device_connection.write_bytes(cached[0])
+        return cached[1]
 
 
 class LRmsMessengerUI:
@@ -204,6 +237,8 @@ class LRmsMessengerUI:
         message_handler (MessageHandler): The message handler object.
         output_buffer (collections.deque): Buffer for storing output messages.
         stop_event (threading.Event): Event for signaling threads to stop.
+        _last_sec (int): Second the cached timestamp was formatted for.
+        _last_ts (str): Cached formatted timestamp.
     """
 
     def __init__(self, device_connection, message_handler, max_lines=100):
@@ -219,6 +254,8 @@ class LRmsMessengerUI:
         self.message_handler = message_handler
         self.output_buffer = deque(maxlen=max_lines)
         self.stop_event = threading.Event()
+        self._last_sec = 0
+        self._last_ts = ""
 
     def add_message(self, message):
         """
@@ -227,8 +264,20 @@ class LRmsMessengerUI:
         Args:
             message (str): The message to add.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.output_buffer.append(f"[{timestamp}] {message}")
+        self.output_buffer.append(f"[{self._ts()}] {message}")
+
+    def _ts(self):
+        """
+        Get the current timestamp, reformatting it at most once a second.
+
+        Returns:
+            str: The formatted timestamp.
+        """
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        return self._last_ts
 
     def display_menu(self):
         """
@@ -293,10 +342,14 @@ class LRmsMessengerUI:
         Args:
             message (dict): The parsed message dictionary.
         """
+        stationid, rssi, snr = (
+            message[key].decode('ascii', 'replace')
+            for key in ("stationid", "rssi", "snr"))
+        msgcontent = message["msgcontent"].decode('utf-8', 'replace')
         print("-" * 45)
-        print(f"Message from: {message['stationid']}")
-        print(f"RSSI: {message['rssi']} SNR: {message['snr']}")
-        print(message['msgcontent'])
+        print(f"Message from: {stationid}")
+        print(f"RSSI: {rssi} SNR: {snr}")
+        print(msgcontent)
         print("-" * 45)
 
     def send_message(self):
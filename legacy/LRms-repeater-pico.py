@@ -21,6 +21,10 @@ class DeviceConnection:
         node_id (int): Node ID for the device.
         tx_power (int): Transmission power in dBm.
         lora_params (str): LoRa parameters string.
+        _rx_buf (bytearray): Receive buffer filled from the UART IRQ.
+        _rx_mv (memoryview): View onto the receive buffer.
+        _rx_head (int): Number of bytes currently held in the receive buffer.
+        _rx_scan (int): Number of buffered bytes already searched for a line ending.
     """
 
     def __init__(self, tx_pin=0, rx_pin=1, rf_freq=867500000, node_id=100, tx_power=22, lora_params='9,7,1,12', device_type='RYLR993'):
@@ -50,26 +54,75 @@ class DeviceConnection:
         self.node_id = node_id
         self.tx_power = tx_power
         self.lora_params = lora_params
+        self._rx_buf = bytearray(512)
+        self._rx_mv = memoryview(self._rx_buf)
+        self._rx_head = 0
+        self._rx_scan = 0
+        # UART.irq() needs MicroPython 1.24 or later on the Pico. Without it
+        # read_serial() pulls bytes from the UART itself while it waits.
+        if hasattr(machine.UART, 'IRQ_RXIDLE'):
+            self.uart.irq(handler=self._on_rx, trigger=machine.UART.IRQ_RXIDLE)
+
+    def _on_rx(self, uart):
+        """
+        UART IRQ handler, moves any received bytes into the receive buffer.
+
+        When the buffer is full the bytes are left in the UART until
+        read_serial() has taken lines out and made room.
+
+        Args:
+            uart (machine.UART): The UART that raised the interrupt.
+        """
+        n = min(uart.any(), len(self._rx_buf) - self._rx_head)
+        if n:
+            self._rx_head += uart.readinto(
+                self._rx_mv[self._rx_head:self._rx_head + n], n) or 0
 
     def read_serial(self, timeout=5000):
         """
-        Read data from the UART connection.
+        Read a line of data from the UART connection.
+
+        Sleeps until a complete line has been buffered, rather than polling
+        the UART. Each wake only searches bytes that arrived since the last
+        one, and nothing is allocated until a line is returned.
 
         Args:
             timeout (int): Timeout in milliseconds.
 
         Returns:
-            bytes: Data read from the UART connection.
-        """
-        start_time = time.time.ticks_ms()
-        received_data = b''
-        while not received_data.endswith(b'\r\n'):
-            if time.time.ticks_diff(time.time.ticks_ms(), start_time) > timeout:
-                break
-            new_data = self.uart.read()
-            if new_data:
-                received_data += new_data
-        return received_data
+            bytes: Data read from the UART connection, or b'' on timeout.
+        """
+        buf = self._rx_buf
+        size = len(buf)
+        start_time = time.ticks_ms()
+        while True:
+            if self._rx_head < size and self.uart.any():
+                # Bytes the IRQ left behind for lack of room, or no IRQ at all
+                state = machine.disable_irq()
+                self._on_rx(self.uart)
+                machine.enable_irq(state)
+            head = self._rx_head
+            for i in range(self._rx_scan, head):
+                if buf[i] == 10 and i and buf[i - 1] == 13:  # '\r\n'
+                    end = i + 1
+                    data = bytes(self._rx_mv[:end])
+                    state = machine.disable_irq()
+                    remaining = self._rx_head - end
+                    buf[:remaining] = self._rx_mv[end:self._rx_head]
+                    self._rx_head = remaining
+                    self._rx_scan = 0
+                    machine.enable_irq(state)
+                    return data
+            if head == size:
+                # Full without a line ending, it can never complete so drop it
+                state = machine.disable_irq()
+                self._rx_head = 0
+                machine.enable_irq(state)
+                head = 0
+            self._rx_scan = head
+            if time.ticks_diff(time.ticks_ms(), start_time) > timeout:
+                return b''
+            machine.idle()
 
     def write_serial(self, text):
         """
@@ -80,6 +133,15 @@ class DeviceConnection:
         """
         self.uart.write(text.encode())
 
+    def write_bytes(self, data):
+        """
+        Write pre-encoded data to the UART connection.
+
+        Args:
+            data (bytes): Data to be written to the UART connection.
+        """
+        self.uart.write(data)
+
     def configure_device(self):
         """
         Configure the LoRa device with the specified settings.
@@ -108,8 +170,9 @@ class DeviceConnection:
         self.write_serial(f'AT+PARAMETER={self.lora_params}\r\n')
         time.sleep(1)
 
-        for _ in range(10):  # Read and discard any responses
-            self.uart.readline()
+        state = machine.disable_irq()
+        self._rx_head = self._rx_scan = 0  # Discard any responses
+        machine.enable_irq(state)
 
 
 class MessageHandler:
@@ -121,6 +184,7 @@ class MessageHandler:
     Attributes:
         device_connection (DeviceConnection): The device connection object.
         station_id (str): The ID of this station.
+        _via (bytes): Pre-encoded "VIA<station_id>" suffix for repeated messages.
     """
 
     def __init__(self, device_connection, station_id):
@@ -133,6 +197,7 @@ class MessageHandler:
         """
         self.device_connection = device_connection
         self.station_id = station_id
+        self._via = f"VIA{station_id}".encode()
 
     def process_message(self, received_data):
         """
@@ -158,13 +223,11 @@ class MessageHandler:
         sender_id = parts[0].split("=")[1]
         message_text = parts[2].strip()
 
-        total_chars = len(message_text) + len(sender_id) + \
-            len(" VIA") + len(self.station_id)
-        repeated_message = f"AT+SEND=0,{total_chars},{
-            message_text} {sender_id}VIA{self.station_id}\r\n"
+        body = message_text.encode() + b" " + sender_id.encode() + self._via
+        frame = b"AT+SEND=0," + str(len(body)).encode() + b"," + body + b"\r\n"
 
-        self.device_connection.write_serial(repeated_message)
-        return f"Repeated message: {repeated_message.strip()}"
+        self.device_connection.write_bytes(frame)
+        return f"Repeated message: {frame.decode().strip()}"
 
 
 class RepeaterApplication:
@@ -23,17 +23,21 @@ def connect(device_type):
         device_type (str): Type of the LoRa device ('RYLR993' or 'RYLR998').
 
     Returns:
-        DeviceConnection: The device connection object.
+        Serial: The device connection object.
     """
     conn = Serial(device_type=device_type)
-    device_configurator = DeviceConfigurator(
-        conn, 867500000, 1, 22, '9,7,1,12')
-    if device_type == 'RYLR993':
-        device_configurator.configure_rylr993()
-    elif device_type == 'RYLR998':
-        device_configurator.configure_rylr998()
-    else:
-        raise ValueError(f"Invalid device type: {device_type}")
+    try:
+        device_configurator = DeviceConfigurator(
+            conn, 867500000, 1, 22, '9,7,1,12')
+        if device_type == 'RYLR993':
+            device_configurator.configure_rylr993()
+        elif device_type == 'RYLR998':
+            device_configurator.configure_rylr998()
+        else:
+            raise ValueError(f"Invalid device type: {device_type}")
+    except BaseException:
+        conn.close()
+        raise
     return conn
 
 
@@ -41,13 +45,13 @@ if __name__ == '__main__':
     # Simple connection UI, will improve later.
     usr_in = input("Select model:\n1. RYLR993\n2. RYLR998\n")
     if usr_in == '1':
-        device_connection = connect('RYLR993')
+        model = 'RYLR993'
     elif usr_in == '2':
-        device_connection = connect('RYLR998')
+        model = 'RYLR998'
     else:
         raise ValueError('Invalid input')
-    run_ui(device_connection)
+    with connect(model) as device_connection:
+        run_ui(device_connection)
 
     print("Exiting program...")
-    device_connection.close()
     sys.exit(0)
@@ -10,6 +10,14 @@ Does not send the commands, only creates them as an object.
 from .message import Message
 from .device_connection import Serial
 
+AT_RESET = b'AT+RESET\r\n'
+AT_RST = b'AT+RST\r\n'
+AT_SEND_HDR = b'AT+SEND=0,'
+CRLF = b'\r\n'
+
+# Size of the reusable transmit buffer, comfortably above the module's 240 byte payload limit
+TX_BUF_SIZE = 512
+
 
 class Command:
     """
@@ -20,31 +28,52 @@ class Command:
     - SEND: Send a message to the LoRa device.
     """
 
+    __slots__ = ('connection', '_tx', '_tx_view')
+
     def __init__(self, connection: Serial):
         """
         Initialise the Command object.
 
         Arguments:
-            connection (DeviceConnection): The device connection object.
+            connection (Serial): The device connection object.
         """
         self.connection = connection
+        self._tx = bytearray(TX_BUF_SIZE)
+        self._tx_view = memoryview(self._tx)
+        self._tx[:len(AT_SEND_HDR)] = AT_SEND_HDR
 
     def send_msg(self, message: Message):
         """
         Takes a message object, prepares it, and sends it to over RF via the serial device.
 
+        The frame is assembled in a buffer reused across sends.
+
         Arguments:
             message (Message): The message object to send.
+
+        Raises:
+            ValueError: If the message is too long to fit in the transmit buffer.
         """
-        msg_bytes = message.encode()
-        prepared = f"AT+SEND=0,{len(msg_bytes)},{msg_bytes}\r\n"
-        self.connection.write_serial(prepared.encode())
+        payload = message.encode()
+        length = b"%d," % len(payload)
+        end = len(AT_SEND_HDR) + len(length) + len(payload) + len(CRLF)
+        if end > TX_BUF_SIZE:
+            raise ValueError(f"Message too long to send: {len(payload)} bytes")
+
+        tx = self._tx
+        pos = len(AT_SEND_HDR)
+        tx[pos:pos + len(length)] = length
+        pos += len(length)
+        tx[pos:pos + len(payload)] = payload
+        pos += len(payload)
+        tx[pos:end] = CRLF
+        self.connection.write_fast(self._tx_view[:end])
 
     def reset(self):
         """
         Resets the LoRa device.
         """
-        self.connection.write_serial(b"AT+RST\r\n")
+        self.connection.write_serial(AT_RST)
 
     def custom_at_cmd(self, command: str):
         """
@@ -9,8 +9,17 @@ All this needs to do is:
 Anything more should be done by another module.
 """
 
+from time import monotonic
+import os
+import re
 import serial
 
+# Default baud rate of each supported device type
+_BAUD = {'RYLR993': 9600, 'RYLR998': 115200}
+
+# Replies from the device that callers wait on, anything else is noise
+_REPLY_RE = re.compile(rb'\+(?:OK|ERR=\d+|RCV=[^\r]+|READY)(?=\r\n)')
+
 
 class Serial:
     """
@@ -26,12 +35,16 @@ class Serial:
         node_id (int): Node ID for the device.
         tx_power (int): Transmission power in dBm.
         lora_params (str): LoRa parameters string.
+        _rx_buf (bytearray): Received bytes not yet returned as a complete line.
+        _fd (int): File descriptor of the serial port.
     """
 
+    __slots__ = ('conn', 'device_type', 'rf_freq', 'node_id', 'tx_power', 'lora_params', '_rx_buf', '_fd')
+
     def __init__(self, port: str = '/dev/ttyS0', rf_freq: int = 867500000, node_id: int = 1, tx_power: int = 22,
                  lora_params: str = '9,7,1,12', device_type: str = 'RYLR993'):
         """
-        Initialise the DeviceConnection, creating a serial connection.
+        Initialise the Serial connection to the device.
 
         Args:
             port (str): Serial port path.
@@ -44,44 +57,178 @@ class Serial:
         Raises:
             ValueError: If an invalid device type is provided.
         """
-        if device_type not in ['RYLR993', 'RYLR998']:
-            raise ValueError('Device type must be RYLR993 or RYLR998')
-        baud_rates = {'RYLR993': 9600, 'RYLR998': 115200}
-        self.conn = serial.Serial(port, baud_rates[device_type], timeout=1)
+        try:
+            baud = _BAUD[device_type]
+        except KeyError:
+            raise ValueError('Device type must be RYLR993 or RYLR998') from None
+        self.conn = serial.Serial(port, baud, timeout=1)
+        try:
+            # Same as `setserial <port> low_latency`, stops the driver holding
+            # received bytes back for up to ~16ms before handing them over.
+            self.conn.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass  # Not supported by this platform or UART driver
         self.device_type = device_type
         self.rf_freq = rf_freq
         self.node_id = node_id
         self.tx_power = tx_power
         self.lora_params = lora_params
+        self._rx_buf = bytearray()
+        self._fd = self.conn.fileno()
 
     def read_serial(self, max_reads: int = 100):
         """
         Read data from the serial connection.
 
+        Each read takes everything waiting on the port at once. Complete lines
+        are yielded, a trailing partial line is kept for the next call.
+
         Args:
             max_reads (int): Maximum number of read attempts.
 
         Yields:
-            bytes: Raw data read from the serial connection.
+            str: Decoded lines read from the serial connection.
         """
         for _ in range(max_reads):
-            data = self.conn.readline()
+            data = self.conn.read(self.conn.in_waiting or 1)
             if not data:
                 break
-            yield data
+            self._rx_buf += data
+            line = self._pop_line()
+            while line is not None:
+                if line:
+                    yield line.decode('utf-8', 'replace')
+                line = self._pop_line()
+
+    def wait_for_line(self, match: bytes = b'+OK', timeout: float = 2.0) -> bool:
+        """
+        Wait for the device to reply with a line starting with `match`.
+
+        Other replies received in the meantime are discarded. The wait may run
+        over `timeout` by up to the port's read timeout if the device is silent.
 
-    def write_serial(self, data: bytes):
+        Args:
+            match (bytes): Start of the expected reply line.
+            timeout (float): Seconds to wait for the reply.
+
+        Returns:
+            bool: True if the reply arrived, False on an error reply or timeout.
+        """
+        deadline = monotonic() + timeout
+        reply = self.read_reply(timeout)
+        while reply is not None:
+            if reply.startswith(match):
+                return True
+            if reply.startswith(b'+ERR'):
+                return False
+            reply = self.read_reply(deadline - monotonic())
+        return False
+
+    def read_reply(self, timeout: float = 2.0):
+        """
+        Read the next +OK, +ERR, +RCV or +READY reply from the device.
+
+        Anything received before the reply is discarded. The wait may run
+        over `timeout` by up to the port's read timeout if the device is silent.
+
+        Args:
+            timeout (float): Seconds to wait for a reply.
+
+        Returns:
+            bytes: The reply without its line ending, or None on timeout.
+        """
+        deadline = monotonic() + timeout
+        while True:
+            match = _REPLY_RE.search(self._rx_buf)
+            if match:
+                reply = bytes(match.group())
+                del self._rx_buf[:match.end() + 2]
+                return reply
+            if monotonic() >= deadline:
+                return None
+            self._rx_buf += self.conn.read(self.conn.in_waiting or 1)
+
+    def _pop_line(self):
+        """
+        Take the next complete line out of the receive buffer.
+
+        Returns:
+            bytes: The line with surrounding whitespace stripped, or None if
+            no complete line is buffered.
+        """
+        end = self._rx_buf.find(b'\n')
+        if end < 0:
+            return None
+        line = bytes(self._rx_buf[:end]).strip()
+        del self._rx_buf[:end + 1]
+        return line
+
+    def write_serial(self, data: bytes | str):
         """
         Write data to the serial connection.
 
         Args:
-            data (bytes): data to be written to the serial connection.
+            data (bytes | str): data to be written to the serial connection.
+                Strings are UTF-8 encoded first, bytes are written as-is.
         """
+        if isinstance(data, str):
+            data = data.encode()
         self.conn.write(data)
 
+    def write_all(self, chunks):
+        """
+        Write several pieces of data to the serial connection in one write.
+
+        Args:
+            chunks (Iterable[bytes]): data to be written, in order.
+        """
+        self.write_fast(b''.join(chunks))
+
+    def write_fast(self, data: bytes) -> int:
+        """
+        Write data straight to the serial port's file descriptor.
+
+        This skips pyserial's write wrapper, falling back to it if the port
+        would block or only part of the data could be written.
+
+        Args:
+            data (bytes): data to be written to the serial connection.
+
+        Returns:
+            int: Number of bytes written.
+        """
+        try:
+            written = os.write(self._fd, data)
+        except BlockingIOError:
+            written = 0
+        if written < len(data):
+            self.conn.write(data[written:])
+        return len(data)
+
+    def send_break(self, duration: float = 0.25):
+        """
+        Send a BREAK condition on the serial connection.
+
+        Args:
+            duration (float): Length of the break in seconds.
+        """
+        self.conn.send_break(duration)
+
     def close(self):
         """
         Close the serial connection to the device.
         """
         if self.conn.is_open:
             self.conn.close()
+
+    def __enter__(self):
+        """
+        Use the connection as a context manager, closing it on exit.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Close the serial connection when leaving the with block.
+        """
+        self.close()
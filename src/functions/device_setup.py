@@ -1,12 +1,12 @@
 """
 Handles initial configuration of a supported LoRa device.
 
-This won't use the device_commands module, because it's just for initial setup.
+This won't use the device_commands module's Command class, because it's just for initial setup.
 Instead we will just write the raw commands to the serial connection.
 """
 
-from time import sleep
 from .device_connection import Serial
+from .device_commands import AT_RESET
 
 
 class DeviceConfigurator:
@@ -17,22 +17,64 @@ class DeviceConfigurator:
     exactly what the confugration process is.
     """
 
-    def __init__(self, connection: Serial, rf_freq: int, node_id: int, tx_power: int, lora_params: str):
+    __slots__ = ('connection', 'rf_freq', 'node_id', 'tx_power', 'lora_params', 'use_break',
+                 '_cmds_993', '_cmds_998', '_burst')
+
+    def __init__(self, connection: Serial, rf_freq: int, node_id: int, tx_power: int, lora_params: str,
+                 use_break: bool = False):
         """
         Initialise the DeviceConfigurator.
 
         Args:
-            connection (DeviceConnection): The device connection object.
+            connection (Serial): The device connection object.
             rf_freq (int): Radio frequency in Hz.
             node_id (int): Node ID for the device.
             tx_power (int): Transmission power in dBm.
             lora_params (str): LoRa parameters string.
+            use_break (bool): Reset a RYLR993 with a serial BREAK instead of
+                AT+RESET. Only for modules that respond to BREAK.
+
+        Raises:
+            ValueError: If lora_params is not a valid 'SF,BW,CR,preamble' string.
         """
         self.connection = connection
         self.rf_freq = rf_freq
         self.node_id = node_id
         self.tx_power = tx_power
         self.lora_params = lora_params
+        self.use_break = use_break
+
+        band = f'AT+BAND={rf_freq}\r\n'.encode()
+        address = f'AT+ADDRESS={node_id}\r\n'.encode()
+        crfop = f'AT+CRFOP={tx_power}\r\n'.encode()
+        parameter = b'AT+PARAMETER=%d,%d,%d,%d\r\n' % self._parse_lora_params(lora_params)
+        self._cmds_993 = (AT_RESET, b'AT+OPMODE=1\r\n', AT_RESET, band)
+        self._cmds_998 = (AT_RESET, band)
+        # Settings the module accepts back-to-back, sent in one write
+        self._burst = (address, crfop, parameter)
+
+    @staticmethod
+    def _parse_lora_params(lora_params: str):
+        """
+        Parse and validate a LoRa parameters string.
+
+        Args:
+            lora_params (str): Spreading factor, bandwidth, coding rate and
+                preamble length, e.g. '9,7,1,12'.
+
+        Returns:
+            tuple: The four parameters as integers.
+
+        Raises:
+            ValueError: If the string is malformed or a value is out of range.
+        """
+        try:
+            sf, bw, cr, preamble = map(int, lora_params.split(','))
+        except ValueError:
+            raise ValueError(f"LoRa parameters must be 'SF,BW,CR,preamble', got '{lora_params}'") from None
+        if not (5 <= sf <= 12 and 0 <= bw <= 9 and 1 <= cr <= 4 and 4 <= preamble <= 25):
+            raise ValueError(f"LoRa parameters out of range: '{lora_params}'")
+        return sf, bw, cr, preamble
 
     def configure_rylr993(self):
         """
@@ -41,12 +83,17 @@ class DeviceConfigurator:
         This method sends a series of AT commands to set up the device
         according to the initialised parameters.
         """
-        setup_cmds = ['AT+RESET\r\n', 'AT+OPMODE=1\r\n', 'AT+RESET\r\n', f'AT+BAND={self.rf_freq}\r\n',
-                      f'AT+ADDRESS={self.node_id}\r\n', f'AT+CRFOP={self.tx_power}\r\n', f'AT+PARAMETER={self.lora_params}\r\n']
-        for cmd in setup_cmds:
-            self.connection.write_serial(cmd)
-            sleep(2)
-        self.connection.read_serial()
+        cmds = self._cmds_993
+        if self.use_break:
+            # Returns as soon as the module reports it's back up, rather
+            # than always waiting out the full reset delay.
+            self.connection.send_break(0.25)
+            self.connection.wait_for_line(b'+READY', timeout=2.0)
+            cmds = cmds[1:]
+        for cmd in cmds:
+            self.connection.write_fast(cmd)
+            self._wait_for_reply(cmd)
+        self._send_burst()
 
     def configure_rylr998(self):
         """
@@ -55,9 +102,31 @@ class DeviceConfigurator:
         This method sends a series of AT commands to set up the device
         according to the initialised parameters.
         """
-        setup_cmds = ['AT+RESET\r\n', f'AT+BAND={self.rf_freq}\r\n', f'AT+ADDRESS={self.node_id}\r\n',
-                      f'AT+CRFOP={self.tx_power}\r\n', f'AT+PARAMETER={self.lora_params}\r\n']
-        for cmd in setup_cmds:
-            self.connection.write_serial(cmd)
-            sleep(2)
-        self.connection.read_serial()
+        for cmd in self._cmds_998:
+            self.connection.write_fast(cmd)
+            self._wait_for_reply(cmd)
+        self._send_burst()
+
+    def _wait_for_reply(self, cmd: bytes):
+        """
+        Wait until the device is ready for the next command.
+
+        After a reset the device announces +READY once it has rebooted, this
+        is waited for with the old fixed 2 second delay as the upper bound.
+        Anything else waits for the device to acknowledge it.
+
+        Args:
+            cmd (bytes): The command that was just sent.
+        """
+        if cmd is AT_RESET:
+            self.connection.wait_for_line(b'+READY', timeout=2.0)
+        else:
+            self.connection.wait_for_line(timeout=0.5)
+
+    def _send_burst(self):
+        """
+        Send the remaining settings in a single write, then collect a reply for each.
+        """
+        self.connection.write_all(self._burst)
+        for _ in self._burst:
+            self.connection.wait_for_line(timeout=0.5)
@@ -9,23 +9,30 @@ to however the device is connected. This will allow for more flexibility in the
 class Message:
     """
     Describes a message object
+
+    The content is encoded once on creation and held as bytes.
     """
 
-    def __init__(self, content: str = ""):
+    __slots__ = ('_bytes',)
+
+    def __init__(self, content: str | bytes = ""):
         """
         Initialise the Message object.
+
+        Args:
+            content (str | bytes): Message content, strings are UTF-8 encoded.
         """
-        self.content = content.encode()
+        self._bytes = content.encode() if isinstance(content, str) else bytes(content)
 
     def encode(self):
         """
         Encodes the current message content for transmission.
         Eventually we should also compress the message here.
+
+        Returns:
+            bytes: Encoded message content.
         """
-        if isinstance(self.content, str):
-            self.content = self.content.encode()
-        elif isinstance(self.content, bytes):
-            raise TypeError("Attempted to encode an already encoded message.")
+        return self._bytes
 
     def decode(self):
         """
@@ -36,7 +43,4 @@ class Message:
             str: Decoded message string.
         """
         # TODO - Probably more to it than just decoding
-        if isinstance(self.content, bytes):
-            self.content = self.content.decode()
-        elif isinstance(self.content, str):
-            raise TypeError("Attempted to decode a plaintext message.")
+        return self._bytes.decode()